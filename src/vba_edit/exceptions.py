@@ -1,5 +1,7 @@
 # Description: Custom exceptions for the VBA editor.
 
+import re
+
 
 class OfficeError(Exception):
     """Base exception class for Office-related errors."""
@@ -134,6 +136,16 @@ class RPCError(VBAError):
         )
 
 
+# Indicators of RPC server connection issues, matched case-insensitively
+RPC_ERROR_PATTERN = re.compile(
+    r"rpc[- ]server"
+    r"|remote procedure call"
+    r"|0x800706BA"  # RPC server unavailable error code
+    r"|-2147023174",  # Same error in decimal
+    re.IGNORECASE,
+)
+
+
 def check_rpc_error(error: Exception) -> bool:
     """Check if an exception is related to RPC server unavailability.
 
@@ -146,12 +158,4 @@ def check_rpc_error(error: Exception) -> bool:
     Returns:
         bool: True if the error appears to be RPC-related, False otherwise
     """
-    error_str = str(error).lower()
-    rpc_indicators = [
-        "rpc server",
-        "rpc-server",
-        "remote procedure call",
-        "0x800706BA",  # RPC server unavailable error code
-        "-2147023174",  # Same error in decimal
-    ]
-    return any(indicator in error_str for indicator in rpc_indicators)
+    return RPC_ERROR_PATTERN.search(str(error)) is not None
@@ -1,19 +1,27 @@
 from abc import ABC, abstractmethod
 import datetime
+import difflib
+import hashlib
 import json
+import locale
 import logging
 import os
 import re
 import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 
-# Third-party imports
-import win32com.client
-from watchfiles import Change, watch
+# Third-party imports (win32com and watchfiles are imported lazily where they are
+# used, so importing this module does not pay for COM type library loading)
+if TYPE_CHECKING:
+    from watchfiles import Change
 
 # Updated local imports
 from vba_edit.path_utils import (
@@ -80,9 +88,57 @@ OFFICE_MACRO_EXTENSIONS: Dict[str, str] = {
 # Command-line entry points for different Office applications
 OFFICE_CLI_NAMES = {app: f"{app}-vba" for app in OFFICE_MACRO_EXTENSIONS.keys()}
 
+# Order in which source files are imported (classes first, as modules may depend on them)
+VBA_IMPORT_ORDER = (".cls", ".bas", ".frm")
+
+# VBA source file extensions picked up by the file watcher in edit mode
+VBA_SOURCE_EXTENSIONS = VBA_IMPORT_ORDER
+
+# Name prefixes of temporary/lock files written by Office and some editors
+TEMP_FILE_PREFIXES = ("~", "$")
+
+# Worker threads that write component files while the next component is exported
+EXPORT_WORKERS = 4
+
+# Seconds a successful is_document_open check is trusted before probing again
+DOCUMENT_OPEN_CHECK_TTL = 2.0
+
+# Quiet period (ms) the watcher waits for further events before yielding a batch.
+# Editors save through temp files and renames in quick succession; waiting a bit
+# longer than watchfiles' default of 50 ms lets one save arrive as one batch.
+WATCH_DEBOUNCE_STEP_MS = 150
+
+# Seconds after a file was imported by the watcher during which events reporting
+# the same content are treated as duplicates
+WATCH_DUPLICATE_WINDOW = 2.0
+
+# Header lines of a class module as created by VBComponents.Add (whitespace normalized)
+DEFAULT_CLASS_HEADER_LINES = frozenset({"VERSION 1.0 CLASS", "BEGIN", "MultiUse = -1 'True", "END"})
+DEFAULT_CLASS_ATTRIBUTES = {
+    "VB_GlobalNameSpace": "false",
+    "VB_Creatable": "false",
+    "VB_PredeclaredId": "false",
+    "VB_Exposed": "false",
+}
+
+# Code module updates are applied per changed block (ReplaceLine/InsertLines/DeleteLines)
+# only while the new code is similar enough to the current code and both the number of
+# edits and the number of changed lines stay small; otherwise the module is cleared
+# and reloaded in one call
+INCREMENTAL_UPDATE_MIN_RATIO = 0.3
+INCREMENTAL_UPDATE_MAX_EDITS = 50
+INCREMENTAL_UPDATE_MAX_LINES = 200
+
 # Regex pattern for Rubberduck @Folder annotations
 RUBBERDUCK_FOLDER_PATTERN = re.compile(r"'\s*@folder\s*(?:\(\s*)?[\"']([^\"']+)[\"']\s*(?:\))?\s*$", re.IGNORECASE)
 
+# Regex patterns for class module header attributes
+VB_CLASS_ATTRIBUTE_PATTERN = re.compile(r"Attribute VB_(PredeclaredId|Exposed) = (\w+)")
+VB_DESCRIPTION_PATTERN = re.compile(r'Attribute VB_Description = "([^"]*)"')
+VB_ATTRIBUTE_LINE_PATTERN = re.compile(r"^[ \t\r\f\v]*Attribute VB_", re.MULTILINE)
+# Any attribute line, e.g. member attributes such as "Attribute Item.VB_UserMemId = 0"
+VB_ANY_ATTRIBUTE_LINE_PATTERN = re.compile(r"^[ \t\r\f\v]*Attribute ", re.MULTILINE)
+
 # Currently supported apps in vba-edit
 # "access" is only partially supported at this stage and will be included
 # in list as soon as tests are adapted to handle it
@@ -93,6 +149,43 @@ SUPPORTED_APPS = [
 ]
 
 
+def _vba_watch_filter(change: "Change", path: str) -> bool:
+    """Filter for watchfiles that only lets VBA source files through.
+
+    Plain string checks on the raw path are used instead of a regex or Path
+    construction, as the filter runs for every filesystem event. Temporary
+    files (e.g. "~$Module1.bas") are ignored, as they are no VBA modules.
+    """
+    return path.lower().endswith(VBA_SOURCE_EXTENSIONS) and not os.path.basename(path).startswith(TEMP_FILE_PREFIXES)
+
+
+def _find_vba_files(directory: Path, recursive: bool = False) -> List[Path]:
+    """Collect VBA source files below a directory.
+
+    Uses a single os.scandir pass per directory instead of one glob per
+    extension. Files are grouped by extension in VBA_IMPORT_ORDER.
+
+    Args:
+        directory: Directory to search
+        recursive: Whether to descend into subdirectories
+
+    Returns:
+        List of paths to VBA source files
+    """
+    found: Dict[str, List[Path]] = {ext: [] for ext in VBA_IMPORT_ORDER}
+    pending = [os.fspath(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    bucket = found.get(os.path.splitext(entry.name)[1].lower())
+                    if bucket is not None:
+                        bucket.append(Path(entry.path))
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return [path for ext in VBA_IMPORT_ORDER for path in found[ext]]
+
+
 class VBADocumentNames:
     """Document module names across different languages."""
 
@@ -153,22 +246,25 @@ class VBADocumentNames:
         "Слайд",  # Russian
     }
 
+    # Fixed document module names of Excel and Word, for a single set lookup
+    DOCUMENT_MODULE_NAMES = frozenset(EXCEL_WORKBOOK_NAMES | WORD_DOCUMENT_NAMES)
+
+    # Excel sheets and PowerPoint slides: a known prefix followed by a number
+    NUMBERED_MODULE_PATTERN = re.compile(
+        "(?:"
+        + "|".join(re.escape(prefix) for prefix in sorted(EXCEL_SHEET_PREFIXES | POWERPOINT_SLIDE_PREFIXES))
+        + r")\d+"
+    )
+
     @classmethod
     def is_document_module(cls, name: str) -> bool:
         """Check if a name matches any known document module name."""
         # Handle standard document modules (Excel/Word)
-        if name in cls.EXCEL_WORKBOOK_NAMES or name in cls.WORD_DOCUMENT_NAMES:
-            return True
-
-        # Handle Excel sheets
-        if any(name.startswith(prefix) and name[len(prefix) :].isdigit() for prefix in cls.EXCEL_SHEET_PREFIXES):
+        if name in cls.DOCUMENT_MODULE_NAMES:
             return True
 
-        # Handle PowerPoint slides
-        if any(name.startswith(prefix) and name[len(prefix) :].isdigit() for prefix in cls.POWERPOINT_SLIDE_PREFIXES):
-            return True
-
-        return False
+        # Handle Excel sheets and PowerPoint slides
+        return cls.NUMBERED_MODULE_PATTERN.fullmatch(name) is not None
 
 
 # VBA type definitions and constants
@@ -223,6 +319,55 @@ class VBATypes:
         },
     }
 
+    # Fallback for component types not listed in TYPE_INFO
+    UNKNOWN_TYPE_INFO = {"type_name": "Unknown", "extension": ".txt", "cls_header": False}
+
+
+@lru_cache(maxsize=256)
+def _build_minimal_header(name: str, module_type: VBAModuleType) -> str:
+    """Build the minimal header text for a component.
+
+    Cached, as the same modules are imported again and again while watching.
+    """
+    if module_type == VBAModuleType.CLASS:
+        # Class modules need the class declaration and standard attributes
+        header = [
+            "VERSION 1.0 CLASS",
+            "BEGIN",
+            "  MultiUse = -1  'True",
+            "END",
+            f'Attribute VB_Name = "{name}"',
+            "Attribute VB_GlobalNameSpace = False",
+            "Attribute VB_Creatable = False",
+            "Attribute VB_PredeclaredId = False",
+            "Attribute VB_Exposed = False",
+        ]
+    elif module_type == VBAModuleType.FORM:
+        # UserForm requires specific form structure and GUID
+        # {C62A69F0-16DC-11CE-9E98-00AA00574A4F} is the standard UserForm GUID
+        header = [
+            "VERSION 5.00",
+            "Begin {C62A69F0-16DC-11CE-9E98-00AA00574A4F} " + name,
+            f'   Caption         =   "{name}"',
+            "   ClientHeight    =   3000",
+            "   ClientLeft      =   100",
+            "   ClientTop       =   400",
+            "   ClientWidth     =   4000",
+            '   OleObjectBlob   =   "' + name + '.frx":0000',
+            "   StartUpPosition =   1  'CenterOwner",
+            "End",
+            f'Attribute VB_Name = "{name}"',
+            "Attribute VB_GlobalNameSpace = False",
+            "Attribute VB_Creatable = False",
+            "Attribute VB_PredeclaredId = True",
+            "Attribute VB_Exposed = False",
+        ]
+    else:
+        # Standard modules only need the name
+        header = [f'Attribute VB_Name = "{name}"']
+
+    return "\n".join(header)
+
 
 class VBAComponentHandler:
     """Handles VBA component operations independent of Office application type.
@@ -232,6 +377,9 @@ class VBAComponentHandler:
     operations. It serves as a utility class for the main Office-specific handlers.
     """
 
+    # Module types that follow from the file extension alone (.cls needs its header)
+    SUFFIX_MODULE_TYPES = {".bas": VBAModuleType.STANDARD, ".frm": VBAModuleType.FORM}
+
     def __init__(self, use_rubberduck_folders: bool = False):
         """Initialize the component handler.
 
@@ -239,8 +387,10 @@ class VBAComponentHandler:
             use_rubberduck_folders: Whether to process Rubberduck folder annotations
         """
         self.use_rubberduck_folders = use_rubberduck_folders
+        # Class module type per header source, keyed by path and (mtime_ns, size)
+        self._cls_type_cache: Dict[str, Tuple[Tuple[int, int], VBAModuleType]] = {}
 
-    def get_component_info(self, component: Any) -> Dict[str, Any]:
+    def get_component_info(self, component: Any, count_lines: bool = True) -> Dict[str, Any]:
         """Get detailed information about a VBA component.
 
         Analyzes a VBA component and returns metadata including its type,
@@ -248,6 +398,9 @@ class VBAComponentHandler:
 
         Args:
             component: A VBA component object from any Office application
+            count_lines: Whether to query the line count. Reading it goes through
+                the CodeModule and costs extra COM calls, so callers that do not
+                need it can skip it.
 
         Returns:
             Dict containing component metadata with the following keys:
@@ -255,7 +408,7 @@ class VBAComponentHandler:
                 - type: VBA type code
                 - type_name: Human-readable type name
                 - extension: Appropriate file extension
-                - code_lines: Number of lines of code
+                - code_lines: Number of lines of code (None if not counted)
                 - has_cls_header: Whether component requires a class header
 
         Raises:
@@ -263,16 +416,22 @@ class VBAComponentHandler:
         """
         try:
             # Get code line count safely
-            code_lines = component.CodeModule.CountOfLines if hasattr(component, "CodeModule") else 0
+            code_lines = None
+            if count_lines:
+                # One lookup of CodeModule instead of hasattr() followed by access
+                code_module = getattr(component, "CodeModule", None)
+                code_lines = code_module.CountOfLines if code_module is not None else 0
+
+            # Each property access is a COM call, so read name and type only once
+            name = component.Name
+            component_type = component.Type
 
             # Get type info or use defaults for unknown types
-            type_data = VBATypes.TYPE_INFO.get(
-                component.Type, {"type_name": "Unknown", "extension": ".txt", "cls_header": False}
-            )
+            type_data = VBATypes.TYPE_INFO.get(component_type, VBATypes.UNKNOWN_TYPE_INFO)
 
             return {
-                "name": component.Name,
-                "type": component.Type,
+                "name": name,
+                "type": component_type,
                 "type_name": type_data["type_name"],
                 "extension": type_data["extension"],
                 "code_lines": code_lines,
@@ -294,16 +453,40 @@ class VBAComponentHandler:
         Returns:
             VBAModuleType.DOCUMENT or VBAModuleType.CLASS based on header analysis
         """
-        # Extract key attributes
-        predeclared = re.search(r"Attribute VB_PredeclaredId = (\w+)", header)
-        exposed = re.search(r"Attribute VB_Exposed = (\w+)", header)
+        # Extract both key attributes in one pass; the first occurrence of each counts
+        attributes = {}
+        for match in VB_CLASS_ATTRIBUTE_PATTERN.finditer(header):
+            attributes.setdefault(match.group(1), match.group(2).lower())
 
         # Document modules have both attributes set to True
-        if predeclared and exposed and predeclared.group(1).lower() == "true" and exposed.group(1).lower() == "true":
+        if attributes.get("PredeclaredId") == "true" and attributes.get("Exposed") == "true":
             return VBAModuleType.DOCUMENT
 
         return VBAModuleType.CLASS
 
+    def has_default_class_header(self, header: str) -> bool:
+        """Check if a class header only holds what VBComponents.Add creates anyway.
+
+        Such classes can be created from their code alone, without importing a
+        file to carry the header attributes.
+
+        Args:
+            header: Content of the VBA component header
+
+        Returns:
+            bool: True if all header lines and attributes have their default values
+        """
+        for line in header.splitlines():
+            normalized = " ".join(line.split())
+            if not normalized or normalized in DEFAULT_CLASS_HEADER_LINES:
+                continue
+            if not normalized.startswith("Attribute "):
+                return False
+            attribute, _, value = normalized[len("Attribute ") :].partition(" = ")
+            if attribute != "VB_Name" and DEFAULT_CLASS_ATTRIBUTES.get(attribute) != value.lower():
+                return False
+        return True
+
     def get_module_type(self, file_path: Path, in_file_headers: bool = False, encoding: str = "utf-8") -> VBAModuleType:
         """Determine VBA module type from file extension and content.
 
@@ -325,34 +508,65 @@ class VBAComponentHandler:
         if VBADocumentNames.is_document_module(name):
             return VBAModuleType.DOCUMENT
 
-        if suffix == ".bas":
-            return VBAModuleType.STANDARD
-        elif suffix == ".frm":
-            return VBAModuleType.FORM
-        elif suffix == ".cls":
-            # For .cls files, check the header if available
-            if in_file_headers:
-                # When using in-file headers, check the file content directly
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        content = f.read()
-                    header, _ = self.split_vba_content(content)
-                    if header:
-                        return self.determine_cls_type(header)
-                except Exception:
-                    logger.debug(f"Could not read content from {file_path}, treating as regular class module")
-            else:
-                # Use separate header file
-                header_file = file_path.with_suffix(".header")
-                if header_file.exists():
-                    with open(header_file, "r", encoding=encoding) as f:
-                        return self.determine_cls_type(f.read())
+        module_type = self.SUFFIX_MODULE_TYPES.get(suffix)
+        if module_type is not None:
+            return module_type
 
-            logger.debug(f"No header file found for {file_path}, treating as regular class module")
-            return VBAModuleType.CLASS
+        if suffix == ".cls":
+            # The header lives in the file itself or in a separate header file. Its
+            # parsed type is reused as long as that file has not changed.
+            header_source = file_path if in_file_headers else file_path.with_suffix(".header")
+            try:
+                stat = header_source.stat()
+            except OSError:
+                # Nothing to read the type from; no need to probe the file again
+                logger.debug(f"No header found for {file_path}, treating as regular class module")
+                return VBAModuleType.CLASS
+
+            key = str(header_source)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cls_type_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+            module_type = self._read_cls_type(file_path, in_file_headers, encoding)
+            self._cls_type_cache[key] = (signature, module_type)
+            return module_type
 
         raise ValueError(f"Unknown file extension: {suffix}")
 
+    def _read_cls_type(self, file_path: Path, in_file_headers: bool, encoding: str) -> VBAModuleType:
+        """Read the header of a .cls file and determine its module type.
+
+        Args:
+            file_path: Path to the .cls file
+            in_file_headers: Whether headers are embedded in files
+            encoding: Character encoding for reading files
+
+        Returns:
+            VBAModuleType.DOCUMENT or VBAModuleType.CLASS
+        """
+        if in_file_headers:
+            # When using in-file headers, check the file content directly
+            try:
+                with open(file_path, "r", encoding=encoding) as f:
+                    content = f.read()
+                header, _ = self.split_vba_content(content)
+                if header:
+                    return self.determine_cls_type(header)
+            except Exception:
+                logger.debug(f"Could not read content from {file_path}, treating as regular class module")
+        else:
+            # Use separate header file
+            try:
+                with open(file_path.with_suffix(".header"), "r", encoding=encoding) as f:
+                    return self.determine_cls_type(f.read())
+            except FileNotFoundError:
+                pass
+
+        logger.debug(f"No header file found for {file_path}, treating as regular class module")
+        return VBAModuleType.CLASS
+
     def split_vba_content(self, content: str) -> Tuple[str, str]:
         """Split VBA content into header and code sections.
 
@@ -370,21 +584,35 @@ class VBAComponentHandler:
         if not content.strip():
             return "", ""
 
-        lines = content.splitlines()
-        last_attr_idx = -1
+        # Locate the first header attribute in one regex search, so content
+        # without a header (e.g. code files next to .header files) is not
+        # walked line by line
+        first_attribute = VB_ATTRIBUTE_LINE_PATTERN.search(content)
+        if first_attribute is None:
+            return "", content
 
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith("Attribute VB_"):
-                last_attr_idx = i
-            elif last_attr_idx >= 0 and not stripped.startswith("Attribute VB_"):
+        # From there, scan line by line without splitting the whole content;
+        # only the attribute block needs to be looked at
+        pos = first_attribute.start()
+        header_end = -1
+        length = len(content)
+
+        while pos < length:
+            newline = content.find("\n", pos)
+            line_end = length if newline == -1 else newline
+            if content[pos:line_end].strip().startswith("Attribute VB_"):
+                header_end = line_end
+            elif header_end >= 0:
+                break
+            if newline == -1:
                 break
+            pos = newline + 1
 
-        if last_attr_idx == -1:
+        if header_end == -1:
             return "", content
 
-        header = "\n".join(lines[: last_attr_idx + 1])
-        code = "\n".join(lines[last_attr_idx + 1 :])
+        header = content[:header_end]
+        code = content[header_end + 1 :]
 
         return header.strip(), code.strip()
 
@@ -398,74 +626,14 @@ class VBAComponentHandler:
         Returns:
             Minimal valid header for the component type
         """
-        if module_type == VBAModuleType.CLASS:
-            # Class modules need the class declaration and standard attributes
-            header = [
-                "VERSION 1.0 CLASS",
-                "BEGIN",
-                "  MultiUse = -1  'True",
-                "END",
-                f'Attribute VB_Name = "{name}"',
-                "Attribute VB_GlobalNameSpace = False",
-                "Attribute VB_Creatable = False",
-                "Attribute VB_PredeclaredId = False",
-                "Attribute VB_Exposed = False",
-            ]
-        elif module_type == VBAModuleType.FORM:
-            # UserForm requires specific form structure and GUID
-            # {C62A69F0-16DC-11CE-9E98-00AA00574A4F} is the standard UserForm GUID
-            header = [
-                "VERSION 5.00",
-                "Begin {C62A69F0-16DC-11CE-9E98-00AA00574A4F} " + name,
-                f'   Caption         =   "{name}"',
-                "   ClientHeight    =   3000",
-                "   ClientLeft      =   100",
-                "   ClientTop       =   400",
-                "   ClientWidth     =   4000",
-                '   OleObjectBlob   =   "' + name + '.frx":0000',
-                "   StartUpPosition =   1  'CenterOwner",
-                "End",
-                f'Attribute VB_Name = "{name}"',
-                "Attribute VB_GlobalNameSpace = False",
-                "Attribute VB_Creatable = False",
-                "Attribute VB_PredeclaredId = True",
-                "Attribute VB_Exposed = False",
-            ]
+        if module_type == VBAModuleType.FORM:
             logger.info(
                 f"Created minimal header for UserForm: {name} \n"
                 "Consider using the command-line option --save-headers "
                 "in order not to lose previously specified form structure and GUID."
             )
-        else:
-            # Standard modules only need the name
-            header = [f'Attribute VB_Name = "{name}"']
-
-        return "\n".join(header)
-
-    def prepare_import_content(
-        self, name: str, module_type: VBAModuleType, header: str, code: str, in_file_headers: bool = False
-    ) -> str:
-        """Prepare content for VBA component import.
-
-        Args:
-            name: Name of the VBA component
-            module_type: Type of the VBA module
-            header: Header content (may be empty)
-            code: Code content
-            in_file_headers: Whether headers are embedded in files
 
-        Returns:
-            Properly formatted content for import
-        """
-        if in_file_headers:
-            # When in_file_headers is True, return only the code part for AddFromString
-            # The header handling will be done differently (via COM properties, not AddFromString)
-            return code
-        else:
-            if not header and module_type == VBAModuleType.STANDARD:
-                header = self.create_minimal_header(name, module_type)
-
-        return f"{header}\n{code}\n" if header else f"{code}\n"
+        return _build_minimal_header(name, module_type)
 
     def validate_component_header(self, header: str, expected_type: VBAModuleType) -> bool:
         """Validate that a component's header matches its expected type.
@@ -500,12 +668,15 @@ class VBAComponentHandler:
         """
         try:
             # For direct updates, we want just the code without any header
-            # manipulation - the existing module already has its header
-            if component.CodeModule.CountOfLines > 0:
-                component.CodeModule.DeleteLines(1, component.CodeModule.CountOfLines)
+            # manipulation - the existing module already has its header.
+            # CodeModule and its line count are read once; each read is a COM call.
+            code_module = component.CodeModule
+            line_count = code_module.CountOfLines
+            if line_count > 0:
+                code_module.DeleteLines(1, line_count)
 
             if content.strip():
-                component.CodeModule.AddFromString(content)
+                code_module.AddFromString(content)
 
             logger.debug(f"Updated content for: {component.Name}")
         except Exception as e:
@@ -534,11 +705,16 @@ class VBAComponentHandler:
         if not self.use_rubberduck_folders:
             return "", code
 
-        lines = code.splitlines()
         folder_path = ""
-
-        for line in lines:
-            stripped = line.strip()
+        pos = 0
+
+        # Walk the leading lines in place; the rest of the module is never split
+        while pos <= len(code):
+            line_end = code.find("\n", pos)
+            if line_end == -1:
+                line_end = len(code)
+            stripped = code[pos:line_end].strip()
+            pos = line_end + 1
             if not stripped or stripped.startswith("'"):
                 # Look for @Folder annotation
                 match = RUBBERDUCK_FOLDER_PATTERN.match(stripped)
@@ -690,6 +866,14 @@ class OfficeVBAHandler(ABC):
             self.app = None
             self.doc = None
             self.component_handler = VBAComponentHandler(use_rubberduck_folders)
+            self._document_open_checked_at = 0.0
+            self._watch_batch_active = False
+            self._unsaved_changes = False
+            self._watched_components = None
+            self._stop_watching = threading.Event()
+            # SHA-1 and time (monotonic) of each source file as last imported while
+            # watching; lets the watcher drop duplicate events
+            self._file_digests: Dict[str, Tuple[str, float]] = {}
 
             # Configure logging
             log_level = logging.DEBUG if verbose else logging.INFO
@@ -778,18 +962,44 @@ class OfficeVBAHandler(ABC):
         pass
 
     def is_document_open(self) -> bool:
-        """Check if the document is still open and accessible."""
+        """Check if the document is still open and accessible.
+
+        A successful check is remembered for DOCUMENT_OPEN_CHECK_TTL seconds, so a
+        burst of file changes does not probe the document over COM for every file.
+
+        Returns:
+            bool: True if the document is open and accessible
+
+        Raises:
+            RPCError: If connection to the Office application is lost
+            DocumentClosedError: If the document has been closed
+        """
+        if self.doc is None:
+            return False
+
+        if time.monotonic() - self._document_open_checked_at < DOCUMENT_OPEN_CHECK_TTL:
+            return True
+
+        self._document_open_checked_at = 0.0
+        is_open = bool(self._is_document_open_impl())
+        if is_open:
+            self._document_open_checked_at = time.monotonic()
+        return is_open
+
+    def _is_document_open_impl(self) -> bool:
+        """Implementation-specific check whether the document is still open."""
         try:
-            if self.doc is None:
+            doc = self.doc
+            if doc is None:
                 return False
 
             # Try to access document name
-            name = self.doc.Name
+            name = doc.Name
             if callable(name):  # Handle Mock case in tests
                 name = name()
 
             # Check if document is still active
-            return self.doc.FullName == str(self.doc_path)
+            return doc.FullName == str(self.doc_path)
 
         except Exception as e:
             if check_rpc_error(e):
@@ -801,6 +1011,8 @@ class OfficeVBAHandler(ABC):
         try:
             if self.app is None:
                 logger.debug(f"Initializing {self.app_name} application")
+                import win32com.client
+
                 self.app = win32com.client.Dispatch(self.app_progid)
                 if self.app_name != "Access":
                     self.app.Visible = True
@@ -819,9 +1031,16 @@ class OfficeVBAHandler(ABC):
             VBAError: If .frm files are found and save_headers is False
         """
         if not self.save_headers:
-            form_files = list(vba_dir.glob("*.frm"))
-            if form_files:
-                form_names = ", ".join(f.stem for f in form_files)
+            # One directory scan, only looking at entry names
+            try:
+                with os.scandir(vba_dir) as entries:
+                    form_stems = [
+                        entry.name[:-4] for entry in entries if entry.name.lower().endswith(".frm") and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                form_stems = []
+            if form_stems:
+                form_names = ", ".join(form_stems)
                 error_msg = (
                     f"\nERROR: Found UserForm files ({form_names}) but --save-headers is not enabled!\n"
                     f"UserForms require their full header information to maintain form specifications.\n"
@@ -856,6 +1075,30 @@ class OfficeVBAHandler(ABC):
             except Exception as e:
                 raise VBAError("Failed to save document") from e
 
+    @contextmanager
+    def _screen_updating_suspended(self):
+        """Turn off screen updating of the application while the block runs.
+
+        Redrawing the application window after each added or replaced component
+        slows down bulk imports. Applications without a ScreenUpdating property
+        (PowerPoint, Access) are left alone.
+        """
+        previous = None
+        try:
+            previous = self.app.ScreenUpdating
+            self.app.ScreenUpdating = False
+        except Exception:
+            previous = None
+
+        try:
+            yield
+        finally:
+            if previous is not None:
+                try:
+                    self.app.ScreenUpdating = previous
+                except Exception as e:
+                    logger.debug(f"Could not restore screen updating: {str(e)}")
+
     def _save_metadata(self, encodings: Dict[str, Dict[str, Any]]) -> None:
         """Save metadata including encoding information.
 
@@ -873,35 +1116,112 @@ class OfficeVBAHandler(ABC):
                 "encodings": encodings,
             }
 
+            # Compact output keeps the file small for projects with many components.
+            # The format never depends on run options, so the file only changes when
+            # its content does.
+            data = json.dumps(metadata, separators=(",", ":"))
+
             metadata_path = self.vba_dir / "vba_metadata.json"
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            metadata_path.write_bytes(data.encode("utf-8"))
 
             logger.info(f"Metadata saved to {metadata_path}")
 
+        except OSError as e:
+            error_msg = f"Failed to write metadata file: {e.strerror or str(e)}"
+            logger.error(error_msg)
+            raise VBAError(error_msg) from e
         except Exception as e:
             error_msg = "Failed to save metadata"
             logger.error(f"{error_msg}: {str(e)}")
             raise VBAError(error_msg) from e
 
-    def export_component(self, component: Any, directory: Path) -> None:
-        """Export a single VBA component."""
-        temp_file = None
-        try:
-            logger.debug(f"Starting component export for {component.Name}")
-            info = self.component_handler.get_component_info(component)
-            name = info["name"]
-            logger.debug(f"Exporting component {name} with save_headers={self.save_headers}")
-            temp_file = resolve_path(f"{name}.tmp", directory)
+    def _read_text_file(self, file_path: Path) -> str:
+        """Read a source, header or exported file as text in the handler's encoding.
+
+        The file is read in one call and decoded once, instead of going through
+        a buffered text stream. Line endings are normalized to "\n", as a text
+        mode read would do.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Decoded file content
+        """
+        encoding = self.encoding or locale.getpreferredencoding(False)
+        text = file_path.read_bytes().decode(encoding)
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def export_component(self, component: Any, directory: Path, info: Optional[Dict[str, Any]] = None) -> None:
+        """Export a single VBA component.
+
+        Args:
+            component: VBA component to export
+            directory: Target directory
+            info: Component information as returned by get_component_info. Callers
+                that already have it pass it in to avoid reading the COM properties again.
+        """
+        if info is None:
+            try:
+                info = self.component_handler.get_component_info(component)
+            except Exception as e:
+                logger.error(f"Failed to export component {component.Name}: {str(e)}")
+                raise VBAError(f"Failed to export component {component.Name}") from e
 
+        temp_file = self._export_to_temp_file(component, directory, info)
+        self._process_exported_file(temp_file, directory, info)
+
+    def _export_to_temp_file(self, component: Any, directory: Path, info: Dict[str, Any]) -> Path:
+        """Export a component to a temporary file via COM.
+
+        This is the only part of an export that talks to the Office application,
+        so it has to run on the thread that owns the COM objects.
+
+        Args:
+            component: VBA component to export
+            directory: Target directory
+            info: Component information as returned by get_component_info
+
+        Returns:
+            Path to the temporary file
+
+        Raises:
+            VBAError: If the export fails
+        """
+        name = info["name"]
+        logger.debug(f"Starting component export for {name} ({info['code_lines']} lines)")
+        logger.debug(f"Exporting component {name} with save_headers={self.save_headers}")
+        # directory is the already resolved vba_dir; no need to resolve again
+        temp_file = directory / f"{name}.tmp"
+        try:
             # Export to temp file
             logger.debug("About to call component.Export")
             component.Export(str(temp_file))
             logger.debug("Component.Export completed")
+            return temp_file
+        except Exception as e:
+            temp_file.unlink(missing_ok=True)
+            logger.error(f"Failed to export component {name}: {str(e)}")
+            raise VBAError(f"Failed to export component {name}") from e
+
+    def _process_exported_file(self, temp_file: Path, directory: Path, info: Dict[str, Any]) -> None:
+        """Split an exported temporary file and write the component files.
+
+        Only does file I/O and text processing, so it may run on a worker thread.
+        The temporary file is removed in any case.
+
+        Args:
+            temp_file: Temporary file written by _export_to_temp_file
+            directory: Target directory
+            info: Component information as returned by get_component_info
 
+        Raises:
+            VBAError: If the component files cannot be written
+        """
+        name = info["name"]
+        try:
             # Read and process content
-            with open(temp_file, "r", encoding=self.encoding) as f:
-                content = f.read()
+            content = self._read_text_file(temp_file)
 
             # Split content
             header, code = self.component_handler.split_vba_content(content)
@@ -925,14 +1245,14 @@ class OfficeVBAHandler(ABC):
             logger.info(f"Exported: {name}" + (f" (folder: {folder_path})" if folder_path else ""))
 
         except Exception as e:
-            logger.error(f"Failed to export component {component.Name}: {str(e)}")
-            raise VBAError(f"Failed to export component {component.Name}") from e
+            logger.error(f"Failed to export component {name}: {str(e)}")
+            raise VBAError(f"Failed to export component {name}") from e
         finally:
-            if temp_file and Path(temp_file).exists():
-                try:
-                    Path(temp_file).unlink()
-                except OSError:
-                    pass
+            # Unlink directly instead of checking for the file first
+            try:
+                temp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
 
     def import_component(self, file_path: Path, components: Any) -> None:
         """Import a VBA component with app-specific handling.
@@ -950,15 +1270,16 @@ class OfficeVBAHandler(ABC):
         """
         try:
             name = file_path.stem
+            in_file_headers = getattr(self, "in_file_headers", False)
             # Pass in_file_headers flag to get_module_type
             module_type = self.component_handler.get_module_type(
-                file_path, in_file_headers=getattr(self, "in_file_headers", False), encoding=self.encoding
+                file_path, in_file_headers=in_file_headers, encoding=self.encoding
             )
 
             logger.debug(f"Processing module: {name} (Type: {module_type})")
 
             # For in-file headers, we need different logic
-            if getattr(self, "in_file_headers", False):
+            if in_file_headers:
                 self._import_with_in_file_headers(file_path, components, module_type)
             else:
                 # Existing logic for separate header files
@@ -970,9 +1291,8 @@ class OfficeVBAHandler(ABC):
 
             logger.info(f"Successfully processed: {file_path.name}")
 
-            # Only try to save for non-Access applications
-            if self.app_name != "Access":
-                self.save_document()
+            # Saving is left to the callers (import_vba, import_single_file), which
+            # save once after their work is done instead of once per component
 
         except Exception as e:
             logger.error(f"Failed to handle {file_path.name}: {str(e)}")
@@ -983,8 +1303,7 @@ class OfficeVBAHandler(ABC):
         name = file_path.stem
 
         # Read the complete file content
-        with open(file_path, "r", encoding=self.encoding) as f:
-            full_content = f.read().strip()
+        full_content = self._read_text_file(file_path).strip()
 
         # Split into header and code
         header, code = self.component_handler.split_vba_content(full_content)
@@ -1000,15 +1319,29 @@ class OfficeVBAHandler(ABC):
             self._update_document_module(name, code, components)
             return
 
+        # Forms and classes with non-default header attributes need VBA's Import to
+        # carry their headers; a class with a default header is created from its code,
+        # which needs no temporary file. Member attributes (VB_UserMemId, VB_Description
+        # of procedures) left in the code can only be set by Import as well.
+        recreate = module_type == VBAModuleType.FORM or (module_type == VBAModuleType.CLASS and bool(header))
+        import_file = recreate and not (
+            module_type == VBAModuleType.CLASS
+            and self.component_handler.has_default_class_header(header)
+            and not VB_ANY_ATTRIBUTE_LINE_PATTERN.search(code)
+        )
+
         try:
             # Try to get existing component
             component = components(name)
 
-            # For UserForms and Class modules with headers, always use full import via temporary file
-            if module_type == VBAModuleType.FORM or (module_type == VBAModuleType.CLASS and header):
-                logger.debug(f"Using full import for {module_type.name.lower()} with headers: {name}")
+            # Headers can only be set on a fresh component, so remove and recreate it
+            if recreate:
+                logger.debug(f"Recreating {module_type.name.lower()} with headers: {name}")
                 components.Remove(component)
-                self._import_via_temp_file(name, full_content, components)
+                if import_file:
+                    self._import_via_temp_file(name, full_content, components)
+                else:
+                    self._create_new_component(name, code, module_type, components)
             else:
                 # For standard modules or class modules without headers, just update content
                 logger.debug(f"Updating existing component: {name}")
@@ -1016,7 +1349,7 @@ class OfficeVBAHandler(ABC):
 
         except Exception:
             # Component doesn't exist, create new
-            if module_type == VBAModuleType.FORM or (module_type == VBAModuleType.CLASS and header):
+            if import_file:
                 logger.debug(f"Creating new {module_type.name.lower()} with headers via import: {name}")
                 self._import_via_temp_file(name, full_content, components)
             else:
@@ -1028,6 +1361,11 @@ class OfficeVBAHandler(ABC):
 
         This method handles both UserForms and Class modules that have header attributes
         that need to be preserved during import.
+
+        Args:
+            name: Name of the VBA component
+            full_content: Complete module content (header and code)
+            components: VBA components collection
         """
         temp_file = self.vba_dir / f"{name}.tmp"
         try:
@@ -1043,11 +1381,23 @@ class OfficeVBAHandler(ABC):
 
         finally:
             # Clean up temp file
-            if temp_file.exists():
-                temp_file.unlink()
+            temp_file.unlink(missing_ok=True)
+
+    def _create_new_component(
+        self, name: str, code: str, module_type: VBAModuleType, components: Any, header: str = ""
+    ) -> Any:
+        """Create a new VBA component with just the code portion.
+
+        Args:
+            name: Name of the component
+            code: Code to add (without header)
+            module_type: Type of the VBA module
+            components: VBA components collection
+            header: Header whose settable attributes are applied to the component
 
-    def _create_new_component(self, name: str, code: str, module_type: VBAModuleType, components: Any) -> None:
-        """Create a new VBA component with just the code portion."""
+        Returns:
+            The created component
+        """
         if module_type == VBAModuleType.CLASS:
             component = components.Add(VBATypes.VBEXT_CT_CLASSMODULE)
         elif module_type == VBAModuleType.FORM:
@@ -1057,10 +1407,15 @@ class OfficeVBAHandler(ABC):
 
         component.Name = name
 
+        # Set header attributes via COM properties (if any special handling needed)
+        self._apply_header_attributes(component, header)
+
         # Add only the code portion - headers are auto-generated
         if code.strip():
             component.CodeModule.AddFromString(code)
 
+        return component
+
     def _import_with_separate_headers(self, file_path: Path, components: Any, module_type: VBAModuleType) -> None:
         """Import VBA component using separate header files (existing logic)."""
         name = file_path.stem
@@ -1104,9 +1459,14 @@ class OfficeVBAHandler(ABC):
                 header = self.component_handler.create_minimal_header(name, module_type)
                 logger.debug(f"Created minimal header for new module: {name}")
 
-            # Prepare content for new module
-            content = self.component_handler.prepare_import_content(name, module_type, header, code)
-            self._import_new_module(name, content, module_type, components)
+            # Attribute lines left at the top of the code file belong to the header;
+            # AddFromString would otherwise insert them as code
+            code_header, code = self.component_handler.split_vba_content(code)
+            header = "\n".join(part for part in (header.strip(), code_header) if part)
+
+            # Header and code are already separate here; joining them only for
+            # _import_new_module to split them again would copy the module twice
+            self._create_new_component(name, code, module_type, components, header=header)
 
     def _should_force_import(self, module_type: VBAModuleType) -> bool:
         """Determine if a module type requires full import instead of content update.
@@ -1134,27 +1494,12 @@ class OfficeVBAHandler(ABC):
             components: VBA components collection
             in_file_headers: Whether content includes embedded headers
         """
-        # Create appropriate module type
-        if module_type == VBAModuleType.CLASS:
-            component = components.Add(VBATypes.VBEXT_CT_CLASSMODULE)
-        elif module_type == VBAModuleType.FORM:
-            component = components.Add(VBATypes.VBEXT_CT_MSFORM)
-        else:  # Standard module
-            component = components.Add(VBATypes.VBEXT_CT_STDMODULE)
-
-        component.Name = name
-
         if in_file_headers:
             # Split the content into header and code
             header, code = self.component_handler.split_vba_content(content)
-
-            # Set header attributes via COM properties (if any special handling needed)
-            self._apply_header_attributes(component, header)
-
-            # Add only the code portion
-            if code.strip():
-                component.CodeModule.AddFromString(code)
+            self._create_new_component(name, code, module_type, components, header=header)
         else:
+            component = self._create_new_component(name, "", module_type, components)
             self._update_module_content(component, content)
 
     def _apply_header_attributes(self, component: Any, header: str) -> None:
@@ -1179,7 +1524,7 @@ class OfficeVBAHandler(ABC):
                 # Only a few can be modified via COM
                 if "VB_Description" in line:
                     # Extract and set description if supported
-                    match = re.search(r'Attribute VB_Description = "([^"]*)"', line)
+                    match = VB_DESCRIPTION_PATTERN.search(line)
                     if match:
                         try:
                             component.Description = match.group(1)
@@ -1200,21 +1545,69 @@ class OfficeVBAHandler(ABC):
         try:
             # For direct updates, we want just the code without any header
             # manipulation - the existing module already has its header
-            if component.CodeModule.CountOfLines > 0:
-                component.CodeModule.DeleteLines(1, component.CodeModule.CountOfLines)
-
-            if content.strip():
-                component.CodeModule.AddFromString(content)
+            self._sync_code_module(component.CodeModule, content)
 
             logger.debug(f"Updated content for: {component.Name}")
         except Exception as e:
             logger.error(f"Failed to update content for {component.Name}: {str(e)}")
             raise VBAError("Failed to update module content") from e
 
+    def _sync_code_module(self, code_module: Any, code: str) -> None:
+        """Bring a code module in line with the given code.
+
+        Edits made in an external editor usually touch only a few lines. Instead of
+        wiping the module and re-adding everything (which makes the VBE re-parse the
+        whole module), the current lines are diffed against the new code and only
+        the changed ranges are replaced. Large rewrites fall back to the full reload.
+
+        Args:
+            code_module: CodeModule COM object of the component
+            code: New code (without header)
+        """
+        line_count = code_module.CountOfLines
+        if line_count == 0:
+            if code.strip():
+                code_module.AddFromString(code)
+            return
+
+        old_lines = code_module.Lines(1, line_count).splitlines()
+        new_lines = code.splitlines() if code.strip() else []
+
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        edits = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+
+        if not edits:
+            return
+
+        changed_lines = sum((i2 - i1) + (j2 - j1) for _, i1, i2, j1, j2 in edits)
+        if (
+            matcher.ratio() < INCREMENTAL_UPDATE_MIN_RATIO
+            or len(edits) > INCREMENTAL_UPDATE_MAX_EDITS
+            or changed_lines > INCREMENTAL_UPDATE_MAX_LINES
+        ):
+            code_module.DeleteLines(1, line_count)
+            if new_lines:
+                code_module.AddFromString(code)
+            return
+
+        # Apply edits bottom-up so that line numbers of earlier edits stay valid.
+        # Each block costs at most two COM calls; only a single replaced line uses
+        # ReplaceLine.
+        for tag, i1, i2, j1, j2 in reversed(edits):
+            if tag == "replace" and i2 - i1 == 1 and j2 - j1 == 1:
+                code_module.ReplaceLine(i1 + 1, new_lines[j1])
+                continue
+            if tag in ("replace", "delete"):
+                code_module.DeleteLines(i1 + 1, i2 - i1)
+            if tag in ("replace", "insert"):
+                code_module.InsertLines(i1 + 1, "\n".join(new_lines[j1:j2]))
+
     def _handle_form_binary_export(self, name: str) -> None:
         """Handle form binary (.frx) export."""
         try:
-            frx_source = resolve_path(f"{name}.frx", Path(self.doc.FullName).parent)
+            # The open document is self.doc_path (see is_document_open), so its
+            # directory is known without reading FullName over COM
+            frx_source = resolve_path(f"{name}.frx", self.doc_path.parent)
             if frx_source.exists():
                 frx_target = resolve_path(f"{name}.frx", self.vba_dir)
                 try:
@@ -1231,7 +1624,7 @@ class OfficeVBAHandler(ABC):
         try:
             frx_source = resolve_path(f"{name}.frx", self.vba_dir)
             if frx_source.exists():
-                frx_target = resolve_path(f"{name}.frx", Path(self.doc.FullName).parent)
+                frx_target = resolve_path(f"{name}.frx", self.doc_path.parent)
                 try:
                     shutil.copy2(str(frx_source), str(frx_target))
                     logger.debug(f"Imported form binary: {frx_target}")
@@ -1241,18 +1634,38 @@ class OfficeVBAHandler(ABC):
         except PathError as e:
             raise VBAError(f"Failed to handle form binary path: {str(e)}") from e
 
-    @abstractmethod
     def _update_document_module(self, name: str, code: str, components: Any) -> None:
-        """Update an existing document module."""
-        pass
+        """Update an existing document module.
+
+        Document modules (ThisDocument, ThisWorkbook, sheets, slides) cannot be
+        removed and re-imported, so their code is synced in place. Override if an
+        application needs different handling.
+
+        Args:
+            name: Name of the module
+            code: New code (without header)
+            components: VBA components collection
+
+        Raises:
+            VBAError: If the module cannot be updated
+        """
+        try:
+            doc_component = components(name)
+
+            # Replace existing code with the new code
+            self._sync_code_module(doc_component.CodeModule, code)
+
+            logger.info(f"Updated document module: {name}")
+
+        except Exception as e:
+            raise VBAError(f"Failed to update document module {name}") from e
 
     def _read_header_file(self, code_file: Path) -> str:
         """Read the header file if it exists."""
         if self.in_file_headers:
             # Extract header from the code file itself
             try:
-                with open(code_file, "r", encoding=self.encoding) as f:
-                    content = f.read().strip()
+                content = self._read_text_file(code_file).strip()
                 header, _ = self.component_handler.split_vba_content(content)
                 return header
             except Exception as e:
@@ -1260,20 +1673,20 @@ class OfficeVBAHandler(ABC):
                 return ""
         else:
             # Use existing logic for separate header files
+            # Opening directly instead of checking exists() first saves a stat per import
             header_file = code_file.with_suffix(".header")
-            if header_file.exists():
-                try:
-                    with open(header_file, "r", encoding=self.encoding) as f:
-                        return f.read().strip()
-                except Exception as e:
-                    logger.debug(f"Could not read header file {header_file}: {e}")
+            try:
+                return self._read_text_file(header_file).strip()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Could not read header file {header_file}: {e}")
             return ""
 
     def _read_code_file(self, code_file: Path) -> str:
         """Read the code file."""
         try:
-            with open(code_file, "r", encoding=self.encoding) as f:
-                content = f.read().strip()
+            content = self._read_text_file(code_file).strip()
 
             if self.in_file_headers:
                 # Split content to extract only the code part
@@ -1297,27 +1710,51 @@ class OfficeVBAHandler(ABC):
         """
         if self.in_file_headers and header:
             # Combine header and code in single file
-            combined_content = f"{header}\n{code}"
             code_file = directory / f"{name}{info['extension']}"
-            with open(code_file, "w", encoding=self.encoding) as f:
-                f.write(combined_content + "\n")
+            self._write_text_file(code_file, f"{header}\n{code}\n")
             logger.debug(f"Saved code file with embedded header: {code_file}")
         else:
             # Save header if enabled and header content exists
             if self.save_headers and header:
                 header_file = directory / f"{name}.header"
-                with open(header_file, "w", encoding=self.encoding) as f:
-                    f.write(header + "\n")
+                self._write_text_file(header_file, header + "\n")
                 logger.debug(f"Saved header file: {header_file}")
 
             # Save code file
             code_file = directory / f"{name}{info['extension']}"
-            with open(code_file, "w", encoding=self.encoding) as f:
-                f.write(code + "\n")
+            self._write_text_file(code_file, code + "\n")
             logger.debug(f"Saved code file: {code_file}")
 
+    def _write_text_file(self, file_path: Path, text: str) -> None:
+        """Write text in the handler's encoding with a single write call.
+
+        Skips the text I/O stack for these small files. Line endings are
+        translated to the platform's, as a text mode write would do. A file
+        that already has the same content is left untouched, which avoids
+        needless writes and file change events for unchanged modules.
+
+        Args:
+            file_path: File to write
+            text: Text with "\n" line endings
+        """
+        encoding = self.encoding or locale.getpreferredencoding(False)
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        data = text.encode(encoding)
+
+        try:
+            if file_path.stat().st_size == len(data) and file_path.read_bytes() == data:
+                logger.debug(f"Unchanged, not rewritten: {file_path}")
+                return
+        except OSError:
+            pass
+
+        file_path.write_bytes(data)
+
     def watch_changes(self) -> None:
         """Watch for changes in VBA files and update the document."""
+        from watchfiles import Change, watch
+
         try:
             logger.info(f"Watching for changes in {self.vba_dir}...")
             last_check_time = time.time()
@@ -1333,10 +1770,23 @@ class OfficeVBAHandler(ABC):
                 watch_path = self.vba_dir
                 recursive = False
 
-            # Define VBA file extensions we want to watch
-            vba_extensions = {".bas", ".cls", ".frm"}
-
-            for changes in watch(watch_path, recursive=recursive):
+            # Change notifications are unreliable on network shares, so poll UNC paths.
+            # Otherwise watchfiles decides (it honours WATCHFILES_FORCE_POLLING).
+            force_polling = True if str(watch_path).startswith("\\\\") else None
+
+            # Only VBA source files are passed through by the watch filter. The watcher
+            # blocks until files change; when idle it yields an empty batch once per
+            # check interval, so the connection check still runs on schedule.
+            for changes in watch(
+                watch_path,
+                recursive=recursive,
+                watch_filter=_vba_watch_filter,
+                rust_timeout=check_interval * 1000,
+                yield_on_timeout=True,
+                step=WATCH_DEBOUNCE_STEP_MS,
+                stop_event=self._stop_watching,
+                force_polling=force_polling,
+            ):
                 try:
                     # Check connection periodically
                     current_time = time.time()
@@ -1346,63 +1796,106 @@ class OfficeVBAHandler(ABC):
                         last_check_time = current_time
                         logger.debug("Connection check passed")
 
-                    # Filter changes to only include VBA files
-                    vba_changes = []
-                    for change_type, file_path in changes:
-                        path = Path(file_path)
-                        # Only include files with VBA extensions
-                        if path.suffix.lower() in vba_extensions:
-                            vba_changes.append((change_type, file_path))
+                    vba_changes = list(changes)
 
                     if vba_changes:
                         logger.debug(f"Watchfiles detected VBA changes: {vba_changes}")
 
+                    # Handle each file once per batch. Editors that save by replacing the
+                    # file report a deletion and an addition for the same path; the file's
+                    # current state decides which one applies.
+                    pending: Dict[str, Change] = {}
                     for change_type, path in vba_changes:
-                        try:
-                            path = Path(path)
-                            if change_type == Change.deleted:
-                                # Handle deleted files
-                                logger.info(f"Detected deletion of {path.name}")
-                                if not self.is_document_open():
-                                    raise DocumentClosedError(self.document_type)
-
-                                vba_project = self.get_vba_project()
-                                components = vba_project.VBComponents
-                                try:
-                                    component = components(path.stem)
-                                    components.Remove(component)
-                                    logger.info(f"Removed component: {path.stem}")
-                                    self.doc.Save()
-                                except Exception:
-                                    logger.debug(f"Component {path.stem} already removed or not found")
-
-                            elif change_type in (Change.added, Change.modified):
-                                # Handle both added and modified files the same way
-                                action = "addition" if change_type == Change.added else "modification"
-                                logger.debug(f"Processing {action} in {path}")
-                                self.import_single_file(path)
-
-                        except (DocumentClosedError, RPCError) as e:
-                            raise e
-                        except Exception as e:
-                            logger.warning(f"Error handling changes (will retry): {str(e)}")
-                            continue
+                        if pending.get(path, change_type) != change_type:
+                            change_type = Change.modified if os.path.exists(path) else Change.deleted
+                        pending[path] = change_type
+
+                    # While the batch is processed, saves are deferred (the document is saved
+                    # once afterwards) and the components handle is kept for later batches
+                    self._watch_batch_active = True
+                    try:
+                        for path, change_type in pending.items():
+                            try:
+                                path = Path(path)
+                                if change_type == Change.deleted:
+                                    # Handle deleted files
+                                    logger.info(f"Detected deletion of {path.name}")
+                                    # A file recreated with the same content must be imported again
+                                    self._file_digests.pop(str(path), None)
+                                    if not self.is_document_open():
+                                        raise DocumentClosedError(self.document_type)
+
+                                    components = self._get_components()
+                                    try:
+                                        component = components(path.stem)
+                                        components.Remove(component)
+                                        logger.info(f"Removed component: {path.stem}")
+                                        self._save_after_change()
+                                    except Exception:
+                                        logger.debug(f"Component {path.stem} already removed or not found")
+
+                                elif change_type in (Change.added, Change.modified):
+                                    # Handle both added and modified files the same way
+                                    action = "addition" if change_type == Change.added else "modification"
+
+                                    # Editors often report one save as several events; repeating the
+                                    # import for content imported moments ago would cost a full
+                                    # re-import of the component. Only events within a short window
+                                    # are dropped, as a later save of the same content may be meant
+                                    # to overwrite edits made in the VBA editor meanwhile.
+                                    digest = hashlib.sha1(path.read_bytes()).hexdigest()
+                                    recent = self._file_digests.get(str(path))
+                                    if (
+                                        recent is not None
+                                        and recent[0] == digest
+                                        and time.monotonic() - recent[1] < WATCH_DUPLICATE_WINDOW
+                                    ):
+                                        logger.debug(f"Skipping {action} in {path}: duplicate event")
+                                        continue
+
+                                    logger.debug(f"Processing {action} in {path}")
+                                    self.import_single_file(path)
+                                    self._file_digests[str(path)] = (digest, time.monotonic())
+
+                            except (DocumentClosedError, RPCError) as e:
+                                raise e
+                            except Exception as e:
+                                # The cached components handle may be stale; fetch it again
+                                self._watched_components = None
+                                logger.warning(f"Error handling changes (will retry): {str(e)}")
+                                continue
+                    finally:
+                        self._watch_batch_active = False
+
+                    if self._unsaved_changes:
+                        self._unsaved_changes = False
+                        self.doc.Save()
+                        logger.debug("Saved document after processing changes")
 
                 except (DocumentClosedError, RPCError) as error:
                     raise error
                 except Exception as error:
                     logger.warning(f"Error in watch loop (will continue): {str(error)}")
 
-                # Prevent excessive CPU usage but stay responsive
-                time.sleep(0.5)
-
         except KeyboardInterrupt:
             logger.info("\nStopping VBA editor...")
         except (DocumentClosedError, RPCError) as error:
             raise error
         finally:
+            self._watched_components = None
+            # Reset only once the loop is done, so a stop_watching call made before
+            # the loop started is not lost
+            self._stop_watching.clear()
             logger.info("VBA editor stopped.")
 
+    def stop_watching(self) -> None:
+        """Make a running watch_changes return.
+
+        The watcher wakes up on the event right away, so this can be called
+        from another thread without waiting for the next file change.
+        """
+        self._stop_watching.set()
+
     def import_vba(self) -> None:
         """Import VBA content into the Office document."""
         try:
@@ -1415,15 +1908,7 @@ class OfficeVBAHandler(ABC):
             components = vba_project.VBComponents
 
             # Find all VBA files, recursively if Rubberduck folders are enabled
-            vba_files = []
-            if self.use_rubberduck_folders:
-                # Search recursively
-                for ext in [".cls", ".bas", ".frm"]:
-                    vba_files.extend(self.vba_dir.rglob(f"*{ext}"))
-            else:
-                # Search only in root directory
-                for ext in [".cls", ".bas", ".frm"]:
-                    vba_files.extend(self.vba_dir.glob(f"*{ext}"))
+            vba_files = _find_vba_files(self.vba_dir, recursive=self.use_rubberduck_folders)
 
             if not vba_files:
                 logger.info("No VBA files found to import.")
@@ -1434,13 +1919,14 @@ class OfficeVBAHandler(ABC):
                 relative_path = vba_file.relative_to(self.vba_dir)
                 logger.info(f"  - {relative_path}")
 
-            # Import components
-            for vba_file in vba_files:
-                try:
-                    self.import_component(vba_file, components)
-                except Exception as e:
-                    logger.error(f"Failed to import {vba_file.name}: {str(e)}")
-                    continue
+            # Import components; the document is saved once afterwards
+            with self._screen_updating_suspended():
+                for vba_file in vba_files:
+                    try:
+                        self.import_component(vba_file, components)
+                    except Exception as e:
+                        logger.error(f"Failed to import {vba_file.name}: {str(e)}")
+                        continue
 
             # Save if we successfully imported files
             self.save_document()
@@ -1463,15 +1949,9 @@ class OfficeVBAHandler(ABC):
             if not self.is_document_open():
                 raise DocumentClosedError(self.document_type)
 
-            vba_project = self.get_vba_project()
-            components = vba_project.VBComponents
-
             # Import the component
-            self.import_component(file_path, components)
-
-            # Only try to save for non-Access applications
-            if self.app_name != "Access":
-                self.doc.Save()
+            self.import_component(file_path, self._get_components())
+            self._save_after_change()
 
         except (DocumentClosedError, RPCError):
             raise
@@ -1479,6 +1959,37 @@ class OfficeVBAHandler(ABC):
             logger.error(f"Failed to process {file_path.name}: {str(e)}")
             raise VBAError(f"Failed to import {file_path.name}") from e
 
+    def _get_components(self) -> Any:
+        """Get the VBComponents collection of the VBA project.
+
+        While watching for changes the collection is fetched once and reused
+        across batches, instead of going through VBProject for every file.
+
+        Returns:
+            VBA components collection
+        """
+        if self._watched_components is not None:
+            return self._watched_components
+
+        components = self.get_vba_project().VBComponents
+        if self._watch_batch_active:
+            self._watched_components = components
+        return components
+
+    def _save_after_change(self) -> None:
+        """Save the document after a change was applied.
+
+        While watch_changes processes a batch of changes the save is only recorded,
+        and the document is saved once when the batch is done.
+        """
+        # Only try to save for non-Access applications
+        if self.app_name == "Access":
+            return
+        if self._watch_batch_active:
+            self._unsaved_changes = True
+        else:
+            self.doc.Save()
+
     def export_vba(self, save_metadata: bool = False, overwrite: bool = True) -> None:
         """Export VBA modules to files."""
         logger.debug("Starting export_vba operation")
@@ -1497,37 +2008,58 @@ class OfficeVBAHandler(ABC):
 
             # Track exported files for metadata
             encoding_data = {}
-
-            for component in components:
-                try:
-                    info = self.component_handler.get_component_info(component)
-                    base_name = info["name"]
-                    final_file = resolve_path(f"{base_name}{info['extension']}", self.vba_dir)
-                    header_file = resolve_path(f"{base_name}.header", self.vba_dir) if self.save_headers else None
-
-                    # Handle both code and header files
-                    files_to_check = [(final_file, False)]
-                    if header_file:
-                        files_to_check.append((header_file, True))
-
-                    # Check each file
-                    should_export = False
-                    for file_path, is_header in files_to_check:
-                        if overwrite or not file_path.exists():
-                            should_export = True
-                            break
-
-                    if should_export:
-                        self.export_component(component, self.vba_dir)
+            # The form safety check only matters if the document has UserForms
+            has_forms = False
+
+            # COM exports run here one after the other; writing the component files
+            # from each export overlaps with the next export on worker threads
+            with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+                pending_exports = []
+                for component in components:
+                    info = None
+                    try:
+                        # Line counts are only of interest for verbose output
+                        info = self.component_handler.get_component_info(component, count_lines=self.verbose)
+                        has_forms = has_forms or info["type"] == VBATypes.VBEXT_CT_MSFORM
+                        base_name = info["name"]
+                        # self.vba_dir was resolved once in __init__; joining is enough here
+                        final_file = self.vba_dir / f"{base_name}{info['extension']}"
+                        header_file = self.vba_dir / f"{base_name}.header" if self.save_headers else None
+
+                        # Handle both code and header files
+                        files_to_check = [(final_file, False)]
+                        if header_file:
+                            files_to_check.append((header_file, True))
+
+                        # Check each file
+                        should_export = False
+                        for file_path, is_header in files_to_check:
+                            if overwrite or not file_path.exists():
+                                should_export = True
+                                break
+
+                        if should_export:
+                            temp_file = self._export_to_temp_file(component, self.vba_dir, info)
+                            future = executor.submit(self._process_exported_file, temp_file, self.vba_dir, info)
+                            pending_exports.append((future, info))
+                        else:
+                            logger.debug(f"Skipping existing file: {final_file}")
+
+                    except Exception as e:
+                        name = info["name"] if info else component.Name
+                        logger.error(f"Failed to export component {name}: {str(e)}")
+                        continue
+
+                for future, info in pending_exports:
+                    try:
+                        future.result()
                         encoding_data[info["name"]] = {"encoding": self.encoding, "type": info["type_name"]}
-                    else:
-                        logger.debug(f"Skipping existing file: {final_file}")
-
-                except Exception as e:
-                    logger.error(f"Failed to export component {component.Name}: {str(e)}")
-                    continue
+                    except VBAError:
+                        # Already logged by _process_exported_file
+                        continue
 
-            self._check_form_safety(self.vba_dir)  # Check for forms before proceeding
+            if has_forms:
+                self._check_form_safety(self.vba_dir)  # Check for forms before proceeding
 
             # Save metadata if requested
             if save_metadata:
@@ -1535,19 +2067,18 @@ class OfficeVBAHandler(ABC):
                 self._save_metadata(encoding_data)
                 logger.debug("Metadata saved")
 
-            # Show exported files to user if requested
-
-            # Plattform independent way to open the directory commented out
-            # as only Windows is supported for now
-
-            # try:
+            # Show exported files to user if requested.
+            # Opening Explorer is opt-in (open_folder) and must never turn a
+            # successful export into a failure, e.g. on non-interactive hosts
+            logger.info(f"VBA modules exported to: {self.vba_dir}")
             if self.open_folder:
                 logger.debug("Opening export directory...")
-                os.startfile(str(self.vba_dir))
-            else:
-                logger.info(f"VBA modules exported to: {self.vba_dir}")
-            # except AttributeError:
-            #     # os.startfile is Windows only, use platform-specific alternatives
+                try:
+                    os.startfile(str(self.vba_dir))
+                except (AttributeError, OSError) as e:
+                    logger.warning(f"Could not open export directory: {e}")
+
+            # Plattform independent alternatives, kept for when other platforms are supported:
             #     if sys.platform == "darwin":
             #         subprocess.run(["open", str(self.vba_dir)])
             #     else:
@@ -1590,24 +2121,6 @@ class WordVBAHandler(OfficeVBAHandler):
         """Implementation-specific document opening logic."""
         return self.app.Documents.Open(str(self.doc_path))
 
-    def _update_document_module(self, name: str, code: str, components: Any) -> None:
-        """Update an existing document module for Word."""
-        try:
-            doc_component = components(name)
-
-            # Clear existing code
-            if doc_component.CodeModule.CountOfLines > 0:
-                doc_component.CodeModule.DeleteLines(1, doc_component.CodeModule.CountOfLines)
-
-            # Add new code
-            if code.strip():
-                doc_component.CodeModule.AddFromString(code)
-
-            logger.info(f"Updated document module: {name}")
-
-        except Exception as e:
-            raise VBAError(f"Failed to update document module {name}") from e
-
 
 class ExcelVBAHandler(OfficeVBAHandler):
     """Microsoft Excel specific implementation of VBA operations.
@@ -1640,25 +2153,6 @@ class ExcelVBAHandler(OfficeVBAHandler):
         """Implementation-specific document opening logic."""
         return self.app.Workbooks.Open(str(self.doc_path))
 
-    def _update_document_module(self, name: str, code: str, components: Any) -> None:
-        """Update an existing document module for Excel."""
-        try:
-            # Handle ThisWorkbook and Sheet modules
-            doc_component = components(name)
-
-            # Clear existing code
-            if doc_component.CodeModule.CountOfLines > 0:
-                doc_component.CodeModule.DeleteLines(1, doc_component.CodeModule.CountOfLines)
-
-            # Add new code
-            if code.strip():
-                doc_component.CodeModule.AddFromString(code)
-
-            logger.info(f"Updated document module: {name}")
-
-        except Exception as e:
-            raise VBAError(f"Failed to update document module {name}") from e
-
 
 class AccessVBAHandler(OfficeVBAHandler):
     """Microsoft Access specific implementation of VBA operations.
@@ -1711,6 +2205,8 @@ class AccessVBAHandler(OfficeVBAHandler):
 
             # Handle Access-specific initialization
             try:
+                import win32com.client
+
                 # Try to get running instance first
                 app = win32com.client.GetObject("Access.Application")
                 try:
@@ -1794,36 +2290,6 @@ class AccessVBAHandler(OfficeVBAHandler):
         """
         return ""
 
-    def _update_document_module(self, name: str, code: str, components: Any) -> None:
-        """Update module code in Access.
-
-        Access doesn't have document modules like Word/Excel, but we still need this
-        method for the interface. For Access, we'll use it to update any module's content.
-
-        Args:
-            name: Name of the module
-            code: New code to insert
-            components: VBA components collection
-
-        Raises:
-            VBAError: If module update fails
-        """
-        try:
-            component = components(name)
-
-            # Clear existing code
-            if component.CodeModule.CountOfLines > 0:
-                component.CodeModule.DeleteLines(1, component.CodeModule.CountOfLines)
-
-            # Add new code if not empty
-            if code.strip():
-                component.CodeModule.AddFromString(code)
-
-            logger.info(f"Updated module content: {name}")
-
-        except Exception as e:
-            raise VBAError(f"Failed to update module {name}") from e
-
     def save_document(self) -> None:
         """Handle saving in Access.
 
@@ -1840,7 +2306,7 @@ class AccessVBAHandler(OfficeVBAHandler):
                 raise RPCError(self.app_name)
             # Don't raise other errors - Access handles saving automatically
 
-    def is_document_open(self) -> bool:
+    def _is_document_open_impl(self) -> bool:
         """Check if the database is still open and accessible.
 
         Returns:
@@ -1936,24 +2402,3 @@ class PowerPointVBAHandler(OfficeVBAHandler):
                 if check_rpc_error(e):
                     raise RPCError(self.app_name) from e
                 raise VBAError("Failed to save presentation") from e
-
-    def _update_document_module(self, name: str, code: str, components: Any) -> None:
-        """Update module code.
-
-        Since PowerPoint has no document module, this acts like a regular module update.
-        """
-        try:
-            component = components(name)
-
-            # Clear existing code
-            if component.CodeModule.CountOfLines > 0:
-                component.CodeModule.DeleteLines(1, component.CodeModule.CountOfLines)
-
-            # Add new code
-            if code.strip():
-                component.CodeModule.AddFromString(code)
-
-            logger.info(f"Updated module: {name}")
-
-        except Exception as e:
-            raise VBAError(f"Failed to update module {name}") from e
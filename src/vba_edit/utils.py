@@ -3,13 +3,13 @@ import logging
 import logging.handlers
 import os
 import sys
-from functools import wraps
+import tempfile
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Dict, Callable, Optional, Tuple
 
-import chardet
-import pywintypes
-import win32com.client
+# Third-party imports (chardet and pywin32 are imported where they are used, so
+# that importing this module, e.g. for CLI argument parsing, does not load COM)
 
 from vba_edit.exceptions import (
     ApplicationError,
@@ -68,6 +68,13 @@ def setup_logging(verbose: bool = False, logfile: Optional[str] = None) -> None:
 # COM error code for DISP_E_EXCEPTION
 DISP_E_EXCEPTION = -2147352567  # 0x80020005
 
+# App specific scodes reported when VBA project access is not trusted
+VBA_ACCESS_DENIED_SCODES = (
+    "-2146822220",  # "trust access to WORD VBA project object model"
+    "-2146827284",  # "trust access to EXCEL VBA project object model"
+    "-2147188160",  # "trust access to POWERPOINT VBA project object model"
+)
+
 
 def is_vba_access_error(error: Exception) -> bool:
     """Check if an error is related to VBA project access being disabled.
@@ -83,21 +90,14 @@ def is_vba_access_error(error: Exception) -> bool:
         return False
 
     # Check for DISP_E_EXCEPTION
-    if error.args[0] != -2147352567:  # 0x80020005
+    if error.args[0] != DISP_E_EXCEPTION:
         return False
 
     # Verify it's a VBA access error by checking the app specific error code
     try:
         if len(error.args) >= 3 and isinstance(error.args[2], tuple):
             scode = str(error.args[2][5])
-            return any(
-                c in scode
-                for c in [
-                    "-2146822220",  # "trust access to WORD VBA project object model"
-                    "-2146827284",  # "trust access to EXCEL VBA project object model"
-                    "-2147188160",  # "trust access to POWERPOINT VBA project object model"
-                ]
-            )
+            return any(c in scode for c in VBA_ACCESS_DENIED_SCODES)
         # Catch ACCESS VBA error or any other Office app error
         elif isinstance(error.args[2], tuple) and str(error.args[2][3]).lower().endswith(".chm"):
             return True
@@ -121,6 +121,8 @@ def get_vba_error_details(error: Exception) -> Dict[str, str]:
         - description: Detailed error description
         - scode: Specific error code
     """
+    import pywintypes
+
     details = {
         "hresult": "",
         "message": "",
@@ -233,6 +235,8 @@ class VBAFileChangeHandler:
             if self.word is None:
                 self.logger.debug("Initializing Word application")
                 try:
+                    import win32com.client
+
                     self.word = win32com.client.Dispatch("Word.Application")
                     self.word.Visible = True
                     self.doc = self.word.Documents.Open(str(self.doc_path))
@@ -276,31 +280,26 @@ class VBAFileChangeHandler:
                 else:
                     actual_code = ""
 
-                # Convert content to specified encoding
-                content_bytes = actual_code.encode(self.encoding)
-                temp_file = file_path.with_suffix(".temp")
-
-                with open(temp_file, "wb") as f:
-                    f.write(content_bytes)
-
-                # Read back with proper encoding
-                with open(temp_file, "r", encoding=self.encoding) as f:
-                    new_code = f.read()
+                # Round-trip through the target encoding in memory; no temp file needed
+                new_code = actual_code.encode(self.encoding).decode(self.encoding)
 
                 # Update existing ThisDocument module
                 self.logger.debug("Updating ThisDocument module")
-                doc_component.CodeModule.DeleteLines(1, doc_component.CodeModule.CountOfLines)
+                code_module = doc_component.CodeModule
+                code_module.DeleteLines(1, code_module.CountOfLines)
                 if new_code.strip():
-                    doc_component.CodeModule.AddFromString(new_code)
+                    code_module.AddFromString(new_code)
 
             else:
                 self.logger.debug(f"Processing regular component: {component_name}")
-                # Handle regular components
-                content_bytes = content.encode(self.encoding)
-                temp_file = file_path.with_suffix(".temp")
-
-                with open(temp_file, "wb") as f:
-                    f.write(content_bytes)
+                # Handle regular components; the text layer encodes straight into its
+                # buffer, and newline="" keeps line endings exactly as read. A unique
+                # temp file avoids clashing with a leftover from an earlier run.
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding=self.encoding, newline="", suffix=".temp", dir=file_path.parent, delete=False
+                ) as f:
+                    temp_file = Path(f.name)
+                    f.write(content)
 
                 # Remove existing component if it exists
                 try:
@@ -362,6 +361,8 @@ def get_active_office_document(app_type: str) -> str:
     logger.debug(f"Getting active {app_type} document")
     app_class, collection_name, active_doc_property = app_mapping[app_type]
 
+    import win32com.client
+
     try:
         app = win32com.client.GetObject(Class=app_class)
 
@@ -471,6 +472,9 @@ def is_office_app_installed(app_name: str) -> bool:
     if app_name not in app_progids:
         raise ValueError(f"Unsupported application: {app_name}. Must be one of: {', '.join(app_progids.keys())}")
 
+    import pywintypes
+    import win32com.client
+
     app = None
     try:
         # First try to get an active instance
@@ -509,19 +513,32 @@ def detect_vba_encoding(file_path: str) -> Tuple[str, float]:
     """
     logger.debug(f"Detecting encoding for file: {file_path}")
     try:
-        with open(file_path, "rb") as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
-
-            if not result["encoding"]:
-                raise EncodingError(f"Could not detect encoding for file: {file_path}")
-
-            logger.debug(f"Detected encoding: {result['encoding']} (confidence: {result['confidence']})")
-            return result["encoding"], result["confidence"]
+        # chardet is slow on larger files; results are reused until the file changes
+        stat = os.stat(file_path)
+        encoding, confidence = _detect_encoding_cached(os.fspath(file_path), stat.st_size, stat.st_mtime_ns)
+        if not encoding:
+            raise EncodingError(f"Could not detect encoding for file: {file_path}")
+
+        logger.debug(f"Detected encoding: {encoding} (confidence: {confidence})")
+        return encoding, confidence
     except Exception as e:
         raise EncodingError(f"Failed to detect encoding: {e}")
 
 
+@lru_cache(maxsize=256)
+def _detect_encoding_cached(file_path: str, size: int, mtime_ns: int) -> Tuple[Optional[str], float]:
+    """Run chardet on a file.
+
+    Size and modification time are not used here; they are part of the cache key
+    so that a changed file is analyzed again.
+    """
+    import chardet
+
+    with open(file_path, "rb") as f:
+        result = chardet.detect(f.read())
+    return result["encoding"], result["confidence"]
+
+
 @error_handler
 def get_windows_ansi_codepage() -> Optional[str]:
     """Get the Windows ANSI codepage as a Python encoding string.
@@ -554,6 +571,8 @@ class OfficeApp:
     def start(self) -> None:
         """Start the Office application."""
         try:
+            import win32com.client
+
             self.app = win32com.client.Dispatch(self.prog_id)
             if self.app_name != "access":
                 self.app.Visible = True
@@ -1,5 +1,6 @@
 """Tests for Office VBA handling."""
 
+import os
 import tempfile
 import pythoncom
 from pathlib import Path
@@ -18,6 +19,7 @@ from vba_edit.office_vba import (
     ExcelVBAHandler,
     AccessVBAHandler,
     VBAModuleType,
+    _find_vba_files,
 )
 from vba_edit.exceptions import DocumentNotFoundError, DocumentClosedError, RPCError
 
@@ -654,6 +656,295 @@ def test_watch_changes_with_threading(vba_app, tmp_path, request):
     logger.info("✓ All verifications passed!")
 
 
+@pytest.mark.com
+@pytest.mark.office
+def test_stop_watching(mock_word_handler):
+    """Test that stop_watching ends a running watch_changes loop."""
+    pytest.importorskip("watchfiles", reason="watchfiles not available")
+    handler = mock_word_handler
+
+    watcher = threading.Thread(target=handler.watch_changes, daemon=True)
+    watcher.start()
+    time.sleep(0.5)  # Give watcher time to start
+
+    handler.stop_watching()
+    watcher.join(timeout=5)
+    assert not watcher.is_alive()
+
+    # A stop requested before the watcher reaches its loop is not lost
+    handler.stop_watching()
+    watcher = threading.Thread(target=handler.watch_changes, daemon=True)
+    watcher.start()
+    watcher.join(timeout=5)
+    assert not watcher.is_alive()
+    assert not handler._stop_watching.is_set()
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_screen_updating_suspended(mock_word_handler):
+    """Test that screen updating is turned off during bulk work and restored afterwards."""
+    handler = mock_word_handler
+    handler.app.ScreenUpdating = True
+
+    with handler._screen_updating_suspended():
+        assert handler.app.ScreenUpdating is False
+    assert handler.app.ScreenUpdating is True
+
+    with pytest.raises(ValueError):
+        with handler._screen_updating_suspended():
+            raise ValueError("import failed")
+    assert handler.app.ScreenUpdating is True
+
+
+class FakeCodeModule:
+    """Minimal in-memory stand-in for a VBA CodeModule (1-based line numbers)."""
+
+    def __init__(self, code=""):
+        self.lines = code.splitlines()
+        self.calls = []
+
+    @property
+    def CountOfLines(self):
+        return len(self.lines)
+
+    def Lines(self, start, count):
+        return "\r\n".join(self.lines[start - 1 : start - 1 + count])
+
+    def DeleteLines(self, start, count=1):
+        self.calls.append("DeleteLines")
+        del self.lines[start - 1 : start - 1 + count]
+
+    def InsertLines(self, line, code):
+        self.calls.append("InsertLines")
+        self.lines[line - 1 : line - 1] = code.splitlines()
+
+    def ReplaceLine(self, line, code):
+        self.calls.append("ReplaceLine")
+        self.lines[line - 1] = code
+
+    def AddFromString(self, code):
+        self.calls.append("AddFromString")
+        self.lines.extend(code.splitlines())
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_sync_code_module(mock_word_handler):
+    """Test that code module updates only touch the changed lines."""
+    handler = mock_word_handler
+    original = "\n".join(f"' line {i}" for i in range(1, 21))
+
+    # Single changed line is replaced in place
+    code_module = FakeCodeModule(original)
+    changed = original.replace("' line 5", "' line five")
+    handler._sync_code_module(code_module, changed)
+    assert code_module.lines == changed.splitlines()
+    assert code_module.calls == ["ReplaceLine"]
+
+    # Inserted and deleted lines are applied to the affected range only
+    code_module = FakeCodeModule(original)
+    changed_lines = original.splitlines()
+    changed_lines.insert(3, "Option Explicit")
+    del changed_lines[15]
+    handler._sync_code_module(code_module, "\n".join(changed_lines))
+    assert code_module.lines == changed_lines
+    assert "AddFromString" not in code_module.calls
+
+    # Unchanged code results in no COM edits at all
+    code_module = FakeCodeModule(original)
+    handler._sync_code_module(code_module, original)
+    assert code_module.calls == []
+
+    # A complete rewrite falls back to clearing and reloading the module
+    code_module = FakeCodeModule(original)
+    handler._sync_code_module(code_module, "Sub Other()\nEnd Sub")
+    assert code_module.lines == ["Sub Other()", "End Sub"]
+    assert code_module.calls == ["DeleteLines", "AddFromString"]
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_sync_code_module_block_rewrites(mock_word_handler):
+    """Test that rewritten blocks cost a bounded number of COM calls."""
+    handler = mock_word_handler
+
+    # A replaced block of several lines is one delete plus one insert, not one call per line
+    original = "\n".join(f"' line {i}" for i in range(1, 21))
+    changed_lines = original.splitlines()
+    changed_lines[5:10] = [f"' new {i}" for i in range(5)]
+    code_module = FakeCodeModule(original)
+    handler._sync_code_module(code_module, "\n".join(changed_lines))
+    assert code_module.lines == changed_lines
+    assert code_module.calls == ["DeleteLines", "InsertLines"]
+
+    # A large contiguous rewrite falls back to the full reload despite a high similarity
+    original = "\n".join(f"' line {i}" for i in range(1, 2001))
+    changed_lines = original.splitlines()
+    changed_lines[500:1500] = [f"' rewritten {i}" for i in range(1000)]
+    code_module = FakeCodeModule(original)
+    handler._sync_code_module(code_module, "\n".join(changed_lines))
+    assert code_module.lines == changed_lines
+    assert code_module.calls == ["DeleteLines", "AddFromString"]
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_new_module_attributes_not_added_as_code(mock_word_handler):
+    """Test that attribute lines in a code file do not end up in a new module's code."""
+    handler = mock_word_handler
+    code_file = handler.vba_dir / "Module1.bas"
+    code_file.write_text(
+        'Attribute VB_Name = "Module1"\nAttribute VB_Description = "Helpers"\nSub Test()\nEnd Sub\n',
+        encoding="cp1252",
+    )
+
+    component = Mock()
+    component.CodeModule = FakeCodeModule()
+    components = Mock(side_effect=Exception("Component not found"))
+    components.Add.return_value = component
+
+    handler._import_with_separate_headers(code_file, components, VBAModuleType.STANDARD)
+
+    assert component.Name == "Module1"
+    assert component.Description == "Helpers"
+    assert component.CodeModule.lines == ["Sub Test()", "End Sub"]
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_save_metadata_compact(mock_word_handler):
+    """Test that metadata is written compactly, regardless of verbose mode."""
+    import json
+
+    handler = mock_word_handler
+    encodings = {"Module1": {"encoding": "cp1252", "type": "Standard Module"}}
+    metadata_path = handler.vba_dir / "vba_metadata.json"
+
+    handler._save_metadata(encodings)
+    content = metadata_path.read_text(encoding="utf-8")
+    assert "\n" not in content
+    assert json.loads(content)["encodings"] == encodings
+
+    handler.verbose = True
+    handler._save_metadata(encodings)
+    assert "\n" not in metadata_path.read_text(encoding="utf-8")
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_is_document_open_caches_success(mock_word_handler):
+    """Test that a successful open check is reused within the TTL."""
+    handler = mock_word_handler
+    handler._is_document_open_impl = Mock(return_value=True)
+
+    assert handler.is_document_open()
+    assert handler.is_document_open()
+    assert handler._is_document_open_impl.call_count == 1
+
+    # An expired check probes the document again
+    handler._document_open_checked_at = 0.0
+    handler._is_document_open_impl.return_value = False
+    assert not handler.is_document_open()
+    assert not handler.is_document_open()
+    assert handler._is_document_open_impl.call_count == 3
+
+
+@pytest.mark.office
+def test_has_default_class_header():
+    """Test detection of class headers that only carry default attributes."""
+    handler = VBAComponentHandler()
+
+    header = handler.create_minimal_header("Class1", VBAModuleType.CLASS)
+    assert handler.has_default_class_header(header)
+    assert not handler.has_default_class_header(header.replace("VB_PredeclaredId = False", "VB_PredeclaredId = True"))
+    assert not handler.has_default_class_header(header + '\nAttribute VB_Description = "Sample"')
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_class_member_attributes_imported(mock_word_handler):
+    """Test that classes with member attributes are imported, not created from their code."""
+    handler = mock_word_handler
+    header = handler.component_handler.create_minimal_header("Items", VBAModuleType.CLASS)
+    cls_file = handler.vba_dir / "Items.cls"
+    cls_file.write_text(
+        f"{header}\nPublic Property Get Item(ByVal Index As Long) As Variant\n"
+        "Attribute Item.VB_UserMemId = 0\nEnd Property\n",
+        encoding="cp1252",
+    )
+
+    components = Mock(side_effect=Exception("Component not found"))
+    with patch.object(handler, "_import_via_temp_file") as import_file:
+        handler._import_with_in_file_headers(cls_file, components, VBAModuleType.CLASS)
+
+    import_file.assert_called_once()
+    components.Add.assert_not_called()
+
+    # An existing class is removed and imported again the same way
+    components = Mock()
+    with patch.object(handler, "_import_via_temp_file") as import_file:
+        handler._import_with_in_file_headers(cls_file, components, VBAModuleType.CLASS)
+
+    components.Remove.assert_called_once_with(components.return_value)
+    import_file.assert_called_once()
+    components.Add.assert_not_called()
+
+
+@pytest.mark.office
+def test_cls_type_follows_header_changes(temp_dir):
+    """Test that the cached class module type is refreshed when the file changes."""
+    handler = VBAComponentHandler()
+    cls_file = temp_dir / "MyClass.cls"
+
+    cls_file.write_text("Attribute VB_PredeclaredId = True\nAttribute VB_Exposed = True\n", encoding="utf-8")
+    assert handler.get_module_type(cls_file, in_file_headers=True) == VBAModuleType.DOCUMENT
+    assert handler.get_module_type(cls_file, in_file_headers=True) == VBAModuleType.DOCUMENT
+
+    cls_file.write_text("Attribute VB_PredeclaredId = False\nAttribute VB_Exposed = False\n", encoding="utf-8")
+    assert handler.get_module_type(cls_file, in_file_headers=True) == VBAModuleType.CLASS
+
+
+@pytest.mark.com
+@pytest.mark.office
+def test_write_text_file_skips_unchanged(mock_word_handler):
+    """Test that files with identical content are not rewritten."""
+    handler = mock_word_handler
+    code_file = handler.vba_dir / "Module1.bas"
+
+    handler._write_text_file(code_file, "Sub Test()\nEnd Sub\n")
+    mtime = code_file.stat().st_mtime_ns
+    os.utime(code_file, ns=(mtime - 10**9, mtime - 10**9))
+
+    handler._write_text_file(code_file, "Sub Test()\nEnd Sub\n")
+    assert code_file.stat().st_mtime_ns == mtime - 10**9
+
+    handler._write_text_file(code_file, "Sub Other()\nEnd Sub\n")
+    assert "Other" in code_file.read_text(encoding="cp1252")
+
+
+def test_find_vba_files(temp_dir):
+    """Test VBA file discovery order and Rubberduck folder recursion."""
+    (temp_dir / "Sub").mkdir()
+    for name in ["Module1.bas", "Class1.cls", "Form1.frm", "Form1.frx", "notes.txt", "Sub/Nested.bas"]:
+        (temp_dir / name).write_text("", encoding="utf-8")
+
+    assert [p.name for p in _find_vba_files(temp_dir)] == ["Class1.cls", "Module1.bas", "Form1.frm"]
+    assert sorted(p.name for p in _find_vba_files(temp_dir, recursive=True)) == [
+        "Class1.cls",
+        "Form1.frm",
+        "Module1.bas",
+        "Nested.bas",
+    ]
+
+    # Symlinked directories are not followed, so links cannot import files twice or loop
+    try:
+        (temp_dir / "Link").symlink_to(temp_dir / "Sub", target_is_directory=True)
+    except OSError:
+        pytest.skip("Creating symlinks is not permitted here")
+    assert "Link" not in {p.parent.name for p in _find_vba_files(temp_dir, recursive=True)}
+
+
 @pytest.mark.office
 def test_watchfiles_integration():
     """Test that watchfiles is properly integrated and can be imported."""